@@ -2,6 +2,8 @@
 Validation test for Decomposition operator on HUMMBL prototype project
 """
 
+import sys
+
 from transformations.decomposition import decompose
 
 # Test on the actual HUMMBL project
@@ -19,64 +21,70 @@ result = decompose(
     constraints=['empirical validation', 'no premature infrastructure', 'rapid iteration']
 )
 
-print(f"\n{'='*70}")
-print("DECOMPOSITION: HUMMBL Prototype Project")
-print(f"{'='*70}\n")
+# Collect the report and write it in one go rather than one print per line
+lines = []
+emit = lines.append
+
+emit(f"\n{'='*70}")
+emit("DECOMPOSITION: HUMMBL Prototype Project")
+emit(f"{'='*70}\n")
 
-print(f"Total Components: {result.metadata['total_components']}")
-print(f"Complexity: {result.metadata['estimated_complexity']}")
-print(f"Confidence: {result.metadata['confidence']:.2f}")
-print(f"Max Depth: {result.metadata['max_depth']}\n")
+emit(f"Total Components: {result.metadata['total_components']}")
+emit(f"Complexity: {result.metadata['estimated_complexity']}")
+emit(f"Confidence: {result.metadata['confidence']:.2f}")
+emit(f"Max Depth: {result.metadata['max_depth']}\n")
 
-print("COMPONENTS IDENTIFIED:")
-print(f"{'='*70}")
+emit("COMPONENTS IDENTIFIED:")
+emit(f"{'='*70}")
 for i, comp in enumerate(result.components, 1):
-    print(f"\n{i}. {comp.description}")
-    print(f"   Type: {comp.type}")
-    print(f"   Criticality: {comp.criticality['score']:.2f} - {comp.criticality['reason']}")
-    print(f"   Coupling: {comp.coupling['score']:.2f} - {comp.coupling['reason']}")
+    emit(f"\n{i}. {comp.description}")
+    emit(f"   Type: {comp.type}")
+    emit(f"   Criticality: {comp.criticality['score']:.2f} - {comp.criticality['reason']}")
+    emit(f"   Coupling: {comp.coupling['score']:.2f} - {comp.coupling['reason']}")
     if comp.dependencies:
         deps = ', '.join(comp.dependencies)
-        print(f"   Dependencies: {deps}")
+        emit(f"   Dependencies: {deps}")
 
-print(f"\n{'='*70}")
-print("CRITICAL PATH (execution order):")
-print(f"{'='*70}")
+emit(f"\n{'='*70}")
+emit("CRITICAL PATH (execution order):")
+emit(f"{'='*70}")
 for i, comp_id in enumerate(result.critical_path, 1):
-    comp = next(c for c in result.components if c.id == comp_id)
-    print(f"{i}. {comp.description}")
+    comp = result.by_id[comp_id]
+    emit(f"{i}. {comp.description}")
 
 if result.parallelizable:
-    print(f"\n{'='*70}")
-    print("PARALLELIZABLE WORK (can do simultaneously):")
-    print(f"{'='*70}")
+    emit(f"\n{'='*70}")
+    emit("PARALLELIZABLE WORK (can do simultaneously):")
+    emit(f"{'='*70}")
     for i, group in enumerate(result.parallelizable, 1):
-        print(f"\nGroup {i}:")
+        emit(f"\nGroup {i}:")
         for comp_id in group:
-            comp = next(c for c in result.components if c.id == comp_id)
-            print(f"  - {comp.description}")
+            comp = result.by_id[comp_id]
+            emit(f"  - {comp.description}")
 
-print(f"\n{'='*70}")
-print("REASONING TRACE:")
-print(f"{'='*70}")
+emit(f"\n{'='*70}")
+emit("REASONING TRACE:")
+emit(f"{'='*70}")
 for step in result.reasoning['steps']:
-    print(f"  • {step}")
+    emit(f"  • {step}")
 
 if result.warnings:
-    print(f"\n{'='*70}")
-    print("WARNINGS:")
-    print(f"{'='*70}")
+    emit(f"\n{'='*70}")
+    emit("WARNINGS:")
+    emit(f"{'='*70}")
     for warning in result.warnings:
-        print(f"  ⚠️  {warning}")
+        emit(f"  ⚠️  {warning}")
+
+emit(f"\n{'='*70}")
+emit("\nNOW SCORE THIS RESULT:")
+emit("1. Does this help you understand the project? (1-10): ___")
+emit("2. Would you use this to plan your work? (1-10): ___")
+emit("3. Did it catch things you'd miss manually? (1-10): ___")
+emit("4. Is it faster than thinking it through? (1-10): ___")
+emit("5. Would you recommend to others? (1-10): ___")
+emit("\nAVERAGE SCORE: ___/10")
+emit("\nThreshold: ≥7/10 = Success, continue to Inversion")
+emit("           <7/10 = Iterate on Decomposition first")
+emit(f"{'='*70}\n")
 
-print(f"\n{'='*70}")
-print("\nNOW SCORE THIS RESULT:")
-print("1. Does this help you understand the project? (1-10): ___")
-print("2. Would you use this to plan your work? (1-10): ___")
-print("3. Did it catch things you'd miss manually? (1-10): ___")
-print("4. Is it faster than thinking it through? (1-10): ___")
-print("5. Would you recommend to others? (1-10): ___")
-print("\nAVERAGE SCORE: ___/10")
-print("\nThreshold: ≥7/10 = Success, continue to Inversion")
-print("           <7/10 = Iterate on Decomposition first")
-print(f"{'='*70}\n")
+sys.stdout.write("\n".join(lines) + "\n")
@@ -74,6 +74,29 @@ def test_parallelization_detection():
         assert any(len(group) > 1 for group in result.parallelizable)
 
 
+def test_parallelization_respects_transitive_dependencies():
+    """Test that components linked through a dependency chain are never grouped"""
+    # deploy -> test -> build, with no direct deploy -> build edge
+    problem = "we deploy api after we test api. then we test api once we build api."
+    
+    result = decompose(problem)
+    
+    by_id = result.by_id
+    
+    def reachable(comp_id):
+        seen, stack = set(), list(by_id[comp_id].dependencies)
+        while stack:
+            dep_id = stack.pop()
+            if dep_id not in seen:
+                seen.add(dep_id)
+                stack.extend(by_id[dep_id].dependencies)
+        return seen
+    
+    for group in result.parallelizable:
+        for comp_id in group:
+            assert not reachable(comp_id) & set(group)
+
+
 def test_noise_detection():
     """Test detection of different noise types"""
     # Epistemic noise: vague/short problem
@@ -105,6 +128,43 @@ def test_critical_path():
     all_ids = {c.id for c in result.components}
     for comp_id in result.critical_path:
         assert comp_id in all_ids
+    
+    # Components are indexed by ID on the result
+    assert set(result.by_id) == all_ids
+    assert all(result.by_id[c.id] is c for c in result.components)
+
+
+def test_critical_path_is_longest_dependency_chain():
+    """Test critical path follows dependency edges in execution order"""
+    result = decompose(
+        "Build HUMMBL Core MCP server, deploy to Cloudflare Workers",
+        constraints=['zero budget']
+    )
+    
+    by_id = result.by_id
+    path = result.critical_path
+    
+    # Each step depends on the one before it
+    for prev_id, next_id in zip(path, path[1:]):
+        assert prev_id in by_id[next_id].dependencies
+    
+    # No dependency chain is longer than the critical path
+    assert len(path) == result.metadata['max_depth']
+
+
+def test_deep_dependency_chain():
+    """Test depth and critical path on a chain deeper than the recursion limit"""
+    operator = DecompositionOperator()
+    components = [
+        Component(id=f"comp_{i}", description=f"step {i}", type='action')
+        for i in range(5000)
+    ]
+    operator._by_id = {c.id: c for c in components}
+    for prev, comp in zip(components, components[1:]):
+        operator._add_dependency(comp, prev.id)
+    
+    assert operator._calculate_max_depth(components) == len(components)
+    assert operator._find_critical_path(components) == [c.id for c in components]
 
 
 def test_complexity_estimation():
@@ -123,6 +183,23 @@ def test_complexity_estimation():
     assert complex.metadata['estimated_complexity'] in ['high', 'very high']
 
 
+def test_action_extraction():
+    """Test that actions from every verb family are extracted in one pass"""
+    # build (construction), fix (modification), audit (analysis)
+    result = decompose("we will build it, then fix it, then audit it before we ship")
+    
+    actions = {c.extracted_from for c in result.components if c.type == 'action'}
+    assert actions == {'action: build', 'action: fix', 'action: audit'}
+
+
+def test_entity_order_is_stable():
+    """Test that entity components keep first-seen order from the text"""
+    result = decompose("Connect the Gateway to the Ledger, then the Vault and the Gateway")
+    
+    entities = [c.description for c in result.components if c.type == 'entity']
+    assert entities == ['connect', 'gateway', 'ledger', 'vault']
+
+
 def test_constraint_extraction():
     """Test that constraints are properly extracted"""
     problem = "Build system in 2 weeks with zero budget and solo engineer"
@@ -164,6 +241,23 @@ def test_empty_problem():
     assert result.metadata['noise_detected'] is not None
 
 
+def test_repeated_calls_are_cached():
+    """Test that identical inputs reuse the memoized result"""
+    problem = "Build system in 2 weeks with zero budget and solo engineer"
+    
+    first = decompose(problem, context={'team': 'solo'}, constraints=['production-ready'])
+    again = decompose(problem, context={'team': 'solo'}, constraints=['production-ready'])
+    assert again is first
+    
+    # Different arguments are decomposed separately
+    other = decompose(problem, constraints=['empirical validation'])
+    assert other is not first
+    
+    # Unhashable context values bypass the cache
+    uncached = decompose(problem, context={'teams': ['solo']})
+    assert uncached.metadata['total_components'] > 0
+
+
 def test_confidence_scores():
     """Test that confidence scores are reasonable"""
     result = decompose("Build web application with authentication and database")
@@ -9,31 +9,77 @@ Design Principles:
 - Fail gracefully
 """
 
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Set, Literal
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Set, Literal, Callable, Iterable
 import re
-from datetime import datetime
+from time import perf_counter_ns
 
+try:
+    import ahocorasick  # Optional: single-pass multi-pattern sentence matching
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+
+# All extraction patterns fused into one alternation so the problem text is
+# scanned once; each match is bucketed by the name of the group it hit.
+# Multi-word constraints come first so their words aren't claimed by the
+# single-word groups, and capitalized terms come last as the catch-all.
+_MASTER_RE = re.compile(
+    r'(?P<time>\b\d+\s+(?:day|week|month|hour|minute)s?\b)'
+    r'|(?P<budget>\$\d+|\bzero budget\b|no budget)'
+    r'|(?P<team>\b(?:solo|alone|\d+\s+engineers?|\d+\s+person)\b)'
+    r'|(?P<action>\b(?:build|create|implement|develop|design|setup|configure|install|deploy|integrate|test|validate|optimize|refactor|migrate'
+    r'|add|remove|update|modify|fix|enhance|improve'
+    r'|analyze|evaluate|assess|review|audit|investigate)\b)'
+    r'|(?P<tech>\b(?:API|MCP|server|database|worker|service|function|component|module|system|cache|storage|queue|D1|R2|KV|Cloudflare)\b)'
+    r'|(?P<vague>\b(?:maybe|possibly|might|could|approximately)\b)'
+    r'|(?P<cap>(?-i:\b[A-Z][a-zA-Z]+\b))',
+    re.IGNORECASE
+)
+_CAP_WORD_RE = re.compile(r'[A-Z][a-zA-Z]+')
+
+_SKIP_WORDS = {'The', 'A', 'An', 'In', 'On', 'For', 'With', 'To', 'From', 'By'}
+
+# Entities each action most commonly pairs with, in order of preference
+_COMMON_PAIRS: Dict[str, Tuple[str, ...]] = {
+    'build': ('server', 'api', 'system', 'component'),
+    'deploy': ('worker', 'service', 'function'),
+    'integrate': ('database', 'd1', 'api', 'service'),
+    'configure': ('server', 'worker', 'cache'),
+    'test': ('function', 'api', 'component')
+}
+
+
+@dataclass(slots=True)
 class Component:
     """Represents a decomposed component of the problem"""
     id: str
     description: str
     type: Literal['action', 'entity', 'constraint', 'relationship']
-    dependencies: List[str] = field(default_factory=list)
-    coupling: Dict[str, float | str] = field(default_factory=lambda: {
-        'score': 0.5,
-        'reason': 'Initial estimate'
-    })
-    criticality: Dict[str, float | str] = field(default_factory=lambda: {
-        'score': 0.5,
-        'reason': 'Initial estimate'
-    })
-    metadata: Dict[str, float | str] = field(default_factory=lambda: {
-        'extracted_from': '',
-        'confidence': 0.7
-    })
+    dependencies: Set[str] = field(default_factory=set)
+    coupling_score: float = 0.5
+    coupling_reason: str = 'Initial estimate'
+    criticality_score: float = 0.5
+    criticality_reason: str = 'Initial estimate'
+    extracted_from: str = ''
+    confidence: float = 0.7
+    
+    @property
+    def coupling(self) -> Dict[str, float | str]:
+        """Coupling as a {'score', 'reason'} dict (read-only view)"""
+        return {'score': self.coupling_score, 'reason': self.coupling_reason}
+    
+    @property
+    def criticality(self) -> Dict[str, float | str]:
+        """Criticality as a {'score', 'reason'} dict (read-only view)"""
+        return {'score': self.criticality_score, 'reason': self.criticality_reason}
+    
+    @property
+    def metadata(self) -> Dict[str, float | str]:
+        """Extraction metadata as a {'extracted_from', 'confidence'} dict (read-only view)"""
+        return {'extracted_from': self.extracted_from, 'confidence': self.confidence}
 
 
 @dataclass
@@ -45,6 +91,7 @@ class DecompositionResult:
     reasoning: Dict[str, List[str] | List[Dict[str, str]]]
     metadata: Dict[str, int | str | float | Optional[Dict[str, str]]]
     warnings: List[str]
+    by_id: Dict[str, Component] = field(default_factory=dict)
 
 
 class DecompositionOperator:
@@ -57,7 +104,12 @@ class DecompositionOperator:
         self.reasoning: List[str] = []
         self.decisions: List[Dict[str, str]] = []
         self.warnings: List[str] = []
-        
+        self.reverse_deps: Dict[str, List[str]] = defaultdict(list)
+        self._by_id: Dict[str, Component] = {}
+        self._depths: Dict[str, int] = {}
+        self._depth_parent: Dict[str, str] = {}
+        self._topo_order: List[str] = []
+    
     def decompose(self, problem_text: str, 
                   context: Optional[Dict] = None,
                   constraints: Optional[List[str]] = None) -> DecompositionResult:
@@ -72,48 +124,68 @@ class DecompositionOperator:
         Returns:
             DecompositionResult with components and analysis
         """
-        start_time = datetime.now()
+        start_ns = perf_counter_ns()
         self.reasoning = []
         self.decisions = []
         self.warnings = []
+        self.reverse_deps = defaultdict(list)
+        self._by_id = {}
+        self._depths = {}
+        self._depth_parent = {}
+        self._topo_order = []
+        
+        # Single scan of the text feeds passes 1-3. The scan keeps the
+        # original casing (capitalization marks proper nouns); everything
+        # downstream works on the text lowercased once here.
+        buckets = self._scan_text(problem_text)
+        lower_text = problem_text.lower()
         
         # Pass 1: Extract actions (verbs)
-        actions = self._extract_actions(problem_text)
+        actions = self._extract_actions(buckets)
         self.reasoning.append(f"Pass 1: Identified {len(actions)} potential actions")
         
         # Pass 2: Extract entities (nouns)
-        entities = self._extract_entities(problem_text)
+        entities = self._extract_entities(buckets)
         self.reasoning.append(f"Pass 2: Identified {len(entities)} entities")
         
         # Pass 3: Extract constraints
-        all_constraints = self._extract_constraints(problem_text, constraints)
+        all_constraints = self._extract_constraints(buckets, constraints)
         self.reasoning.append(f"Pass 3: Identified {len(all_constraints)} constraints")
         
         # Pass 4: Build component graph
         components = self._build_components(actions, entities, all_constraints)
         self.reasoning.append(f"Pass 4: Generated {len(components)} components")
+        self._by_id = {c.id: c for c in components}
         
         # Pass 5: Detect dependencies
-        self._detect_dependencies(components, problem_text)
+        lower_sentences = [s.strip() for s in re.split(r'[.!?]+', lower_text) if s.strip()]
+        sent_mentions = self._index_mentions(components, lower_sentences)
+        self._detect_dependencies(components, sent_mentions)
         self.reasoning.append("Pass 5: Mapped dependencies")
         
+        # Passes 6-7 score all components at once from index-aligned counts
+        dep_counts = [len(c.dependencies) for c in components]
+        dependent_counts = [len(self.reverse_deps[c.id]) for c in components]
+        confidences = [c.confidence for c in components]
+        
         # Pass 6: Calculate coupling
-        self._calculate_coupling(components)
+        coupling_scores = self._calculate_coupling(components, dep_counts, dependent_counts)
         self.reasoning.append("Pass 6: Calculated coupling scores")
         
         # Pass 7: Determine criticality
-        self._calculate_criticality(components)
+        self._calculate_criticality(components, dependent_counts)
         self.reasoning.append("Pass 7: Identified critical path")
         
-        # Pass 8: Find parallelization opportunities
+        # Pass 8: Find parallelization opportunities and the critical path
+        max_depth = self._calculate_max_depth(components)
         parallelizable = self._find_parallelizable(components)
         critical_path = self._find_critical_path(components)
         
-        duration = (datetime.now() - start_time).total_seconds() * 1000
+        duration = (perf_counter_ns() - start_ns) / 1e6
         self.reasoning.append(f"Decomposition completed in {duration:.2f}ms")
         
         # Detect noise/ambiguity
-        noise = self._detect_noise(problem_text, components)
+        noise = self._detect_noise(problem_text, bool(buckets['vague']), confidences)
         if noise:
             self.warnings.append(f"Detected {noise['type']} noise: {noise['description']}")
         
@@ -127,51 +199,52 @@ class DecompositionOperator:
             },
             metadata={
                 'total_components': len(components),
-                'max_depth': self._calculate_max_depth(components),
-                'estimated_complexity': self._estimate_complexity(components),
-                'confidence': self._calculate_overall_confidence(components),
+                'max_depth': max_depth,
+                'estimated_complexity': self._estimate_complexity(coupling_scores),
+                'confidence': self._calculate_overall_confidence(confidences),
                 'noise_detected': noise
             },
-            warnings=self.warnings
+            warnings=self.warnings,
+            by_id=self._by_id
         )
     
-    def _extract_actions(self, text: str) -> List[str]:
-        """Extract action verbs indicating work to be done"""
-        action_patterns = [
-            r'\b(build|create|implement|develop|design|setup|configure|install|deploy|integrate|test|validate|optimize|refactor|migrate)\b',
-            r'\b(add|remove|update|modify|fix|enhance|improve)\b',
-            r'\b(analyze|evaluate|assess|review|audit|investigate)\b'
-        ]
-        
-        actions = set()
-        for pattern in action_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            actions.update(m.group().lower() for m in matches)
+    def _scan_text(self, text: str) -> Dict[str, List[str]]:
+        """Scan text once, bucketing lowercased matches by pattern group"""
+        buckets: Dict[str, List[str]] = {name: [] for name in _MASTER_RE.groupindex}
+        
+        for m in _MASTER_RE.finditer(text):
+            kind, term = m.lastgroup, m.group()
+            if kind != 'cap':
+                buckets[kind].append(term.lower())
+            
+            # Capitalized words claimed by another group still count as
+            # proper-noun candidates
+            words = (term,) if kind == 'cap' else term.split()
+            buckets['cap'].extend(
+                w.lower() for w in words
+                if w not in _SKIP_WORDS and _CAP_WORD_RE.fullmatch(w)
+            )
         
-        return list(actions)
+        return buckets
     
-    def _extract_entities(self, text: str) -> List[str]:
-        """Extract entities (technical terms and proper nouns)"""
-        entities = set()
+    def _extract_actions(self, buckets: Dict[str, List[str]]) -> List[str]:
+        """Extract action verbs indicating work to be done"""
+        return list(set(buckets['action']))
+    
+    def _extract_entities(self, buckets: Dict[str, List[str]]) -> List[str]:
+        """Extract entities (technical terms and proper nouns), first-seen order"""
+        entities: Dict[str, None] = {}
         
         # Technical entities
-        tech_pattern = r'\b(API|MCP|server|database|worker|service|function|component|module|system|cache|storage|queue|D1|R2|KV|Cloudflare)\b'
-        tech_matches = re.finditer(tech_pattern, text, re.IGNORECASE)
-        entities.update(m.group().lower() for m in tech_matches)
+        entities.update(dict.fromkeys(buckets['tech']))
         
         # Capitalized terms (likely proper nouns)
-        cap_pattern = r'\b[A-Z][a-zA-Z]+\b'
-        cap_matches = re.finditer(cap_pattern, text)
-        
-        skip_words = {'The', 'A', 'An', 'In', 'On', 'For', 'With', 'To', 'From', 'By'}
-        entities.update(
-            m.group().lower() for m in cap_matches 
-            if m.group() not in skip_words
-        )
+        entities.update(dict.fromkeys(buckets['cap']))
         
         return list(entities)
     
-    def _extract_constraints(self, text: str, explicit: Optional[List[str]] = None) -> List[str]:
+    def _extract_constraints(self, buckets: Dict[str, List[str]],
+                             explicit: Optional[List[str]] = None) -> List[str]:
         """Extract constraints (both explicit and implicit)"""
         constraints = set()
         
@@ -179,16 +252,9 @@ class DecompositionOperator:
         if explicit:
             constraints.update(explicit)
         
-        # Detect implicit constraints
-        patterns = {
-            'time': r'\b(\d+\s+(day|week|month|hour|minute)s?)\b',
-            'budget': r'\$\d+|\bzero budget\b|no budget',
-            'team': r'\b(solo|alone|\d+\s+engineer(s)?|\d+\s+person)\b'
-        }
-        
-        for pattern in patterns.values():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            constraints.update(m.group().lower() for m in matches)
+        # Detect implicit constraints (time, budget, team)
+        for kind in ('time', 'budget', 'team'):
+            constraints.update(buckets[kind])
         
         return list(constraints)
     
@@ -200,8 +266,12 @@ class DecompositionOperator:
         id_counter = 0
         
         # Create action-based components
+        entity_set = set(entities)
+        paired: Set[str] = set()
         for action in actions:
-            related_entity = self._find_related_entity(action, entities)
+            related_entity = self._find_related_entity(action, entities, entity_set)
+            if related_entity:
+                paired.add(related_entity)
             
             description = f"{action} {related_entity}" if related_entity else action
             
@@ -209,32 +279,24 @@ class DecompositionOperator:
                 id=f"comp_{id_counter}",
                 description=description,
                 type='action',
-                metadata={
-                    'extracted_from': f"action: {action}",
-                    'confidence': 0.7
-                }
+                extracted_from=f"action: {action}",
+                confidence=0.7
             ))
             id_counter += 1
         
         # Create entity components for unpaired entities
-        paired_entities = [
-            c.description.split(' ', 1)[1] 
-            for c in components 
-            if ' ' in c.description
-        ]
-        
-        unpaired = [e for e in entities if e not in paired_entities]
+        unpaired = [e for e in entities if e not in paired]
         for entity in unpaired:
             components.append(Component(
                 id=f"comp_{id_counter}",
                 description=entity,
                 type='entity',
-                coupling={'score': 0.3, 'reason': 'Entity component'},
-                criticality={'score': 0.3, 'reason': 'Supporting entity'},
-                metadata={
-                    'extracted_from': f"entity: {entity}",
-                    'confidence': 0.6
-                }
+                coupling_score=0.3,
+                coupling_reason='Entity component',
+                criticality_score=0.3,
+                criticality_reason='Supporting entity',
+                extracted_from=f"entity: {entity}",
+                confidence=0.6
             ))
             id_counter += 1
         
@@ -244,12 +306,12 @@ class DecompositionOperator:
                 id=f"comp_{id_counter}",
                 description=f"respect constraint: {constraint}",
                 type='constraint',
-                coupling={'score': 0.8, 'reason': 'Constraint impacts all components'},
-                criticality={'score': 0.9, 'reason': 'Constraint violation = failure'},
-                metadata={
-                    'extracted_from': f"constraint: {constraint}",
-                    'confidence': 0.8
-                }
+                coupling_score=0.8,
+                coupling_reason='Constraint impacts all components',
+                criticality_score=0.9,
+                criticality_reason='Constraint violation = failure',
+                extracted_from=f"constraint: {constraint}",
+                confidence=0.8
             ))
             id_counter += 1
         
@@ -260,59 +322,96 @@ class DecompositionOperator:
         
         return components
     
-    def _find_related_entity(self, action: str, entities: List[str]) -> Optional[str]:
+    def _find_related_entity(self, action: str, entities: List[str],
+                             entity_set: Set[str]) -> Optional[str]:
         """Heuristic to find entity that commonly pairs with action"""
-        common_pairs = {
-            'build': ['server', 'api', 'system', 'component'],
-            'deploy': ['worker', 'service', 'function'],
-            'integrate': ['database', 'd1', 'api', 'service'],
-            'configure': ['server', 'worker', 'cache'],
-            'test': ['function', 'api', 'component']
-        }
-        
-        preferred = common_pairs.get(action, [])
-        
-        for pref in preferred:
-            match = next((e for e in entities if pref in e), None)
-            if match:
-                return match
-        
-        return entities[0] if entities else None
+        for pref in _COMMON_PAIRS.get(action, ()):
+            # Exact term, or its plural ('Cloudflare Workers' -> 'workers')
+            for candidate in (pref, pref + 's'):
+                if candidate in entity_set:
+                    return candidate
+        
+        return next(iter(entities), None)
+    
+    def _index_mentions(self, components: List[Component],
+                        lower_sentences: List[str]) -> Dict[str, Set[int]]:
+        """Map each component ID to the indices of (lowercased) sentences mentioning it"""
+        comp_lc = {c.id: c.description.lower() for c in components}
+        
+        if ahocorasick is not None and comp_lc:
+            return self._index_mentions_automaton(comp_lc, lower_sentences)
+        
+        # A description absent from the whole text is absent from every
+        # sentence, so one check can skip the per-sentence scans
+        joined = '\n'.join(lower_sentences)
+        
+        sent_mentions = {}
+        for comp_id, needle in comp_lc.items():
+            if needle not in joined:
+                sent_mentions[comp_id] = set()
+                continue
+            sent_mentions[comp_id] = {
+                i for i, s in enumerate(lower_sentences) 
+                if needle in s
+            }
+        
+        return sent_mentions
+    
+    def _index_mentions_automaton(self, comp_lc: Dict[str, str],
+                                  lower_sentences: List[str]) -> Dict[str, Set[int]]:
+        """Aho-Corasick variant of _index_mentions: one scan per sentence"""
+        ids_by_needle: Dict[str, List[str]] = defaultdict(list)
+        for comp_id, needle in comp_lc.items():
+            ids_by_needle[needle].append(comp_id)
+        
+        automaton = ahocorasick.Automaton()
+        for needle, ids in ids_by_needle.items():
+            automaton.add_word(needle, tuple(ids))
+        automaton.make_automaton()
+        
+        sent_mentions = {comp_id: set() for comp_id in comp_lc}
+        for i, s in enumerate(lower_sentences):
+            for _, ids in automaton.iter(s):
+                for comp_id in ids:
+                    sent_mentions[comp_id].add(i)
+        
+        return sent_mentions
     
-    def _detect_dependencies(self, components: List[Component], problem_text: str):
+    def _add_dependency(self, comp: Component, dep_id: str):
+        """Record that comp depends on dep_id (and the reverse edge)"""
+        if dep_id in comp.dependencies:
+            return
+        comp.dependencies.add(dep_id)
+        self.reverse_deps[dep_id].append(comp.id)
+    
+    def _detect_dependencies(self, components: List[Component],
+                             sent_mentions: Dict[str, Set[int]]):
         """Detect dependencies between components"""
-        sentences = [s.strip() for s in re.split(r'[.!?]+', problem_text) if s.strip()]
+        constraint_ids = [c.id for c in components if c.type == 'constraint']
         
         for comp in components:
-            # Find sentences mentioning this component
-            relevant = [
-                s for s in sentences 
-                if comp.description.lower() in s.lower()
-            ]
+            # Components mentioned in the same sentence are likely related
+            relevant = sent_mentions[comp.id]
             
-            # Components mentioned together are likely related
-            for other in components:
-                if comp.id == other.id:
-                    continue
-                
-                co_mentioned = any(
-                    other.description.lower() in s.lower() 
-                    for s in relevant
-                )
-                
-                if co_mentioned:
+            if relevant and comp.type == 'action':
+                for other in components:
+                    if comp.id == other.id:
+                        continue
+                    
+                    if not relevant & sent_mentions[other.id]:
+                        continue
+                    
                     # Action components depend on entity components
-                    if comp.type == 'action' and other.type == 'entity':
-                        comp.dependencies.append(other.id)
-                    elif (comp.type == 'action' and other.type == 'action' and
+                    if other.type == 'entity':
+                        self._add_dependency(comp, other.id)
+                    elif (other.type == 'action' and
                           self._is_sequential(comp.description, other.description)):
-                        comp.dependencies.append(other.id)
+                        self._add_dependency(comp, other.id)
             
             # All non-constraint components depend on constraints
             if comp.type != 'constraint':
-                for other in components:
-                    if other.type == 'constraint':
-                        comp.dependencies.append(other.id)
+                for constraint_id in constraint_ids:
+                    self._add_dependency(comp, constraint_id)
     
     def _is_sequential(self, action1: str, action2: str) -> bool:
         """Determine if actions have natural ordering"""
@@ -323,132 +422,165 @@ class DecompositionOperator:
         
         return idx1 != -1 and idx2 != -1 and idx2 < idx1
     
-    def _calculate_coupling(self, components: List[Component]):
+    def _calculate_coupling(self, components: List[Component],
+                            dep_counts: List[int],
+                            dependent_counts: List[int]) -> List[float]:
         """Calculate coupling scores based on connections"""
-        for comp in components:
-            dep_count = len(comp.dependencies)
-            dependent_count = sum(
-                1 for c in components 
-                if comp.id in c.dependencies
-            )
-            
-            total_connections = dep_count + dependent_count
-            max_possible = (len(components) - 1) * 2
-            
-            score = min(total_connections / max(max_possible, 1), 1.0)
-            comp.coupling = {
-                'score': score,
-                'reason': f"{dep_count} dependencies, {dependent_count} dependents"
-            }
+        max_possible = max((len(components) - 1) * 2, 1)
+        scores = [
+            min((deps + dependents) / max_possible, 1.0)
+            for deps, dependents in zip(dep_counts, dependent_counts)
+        ]
+        
+        for comp, score, dep_count, dependent_count in zip(
+                components, scores, dep_counts, dependent_counts):
+            comp.coupling_score = score
+            comp.coupling_reason = f"{dep_count} dependencies, {dependent_count} dependents"
             
             if score > 0.7:
                 self.warnings.append(
                     f"Component '{comp.description}' is highly coupled ({score:.2f})"
                 )
+        
+        return scores
     
-    def _calculate_criticality(self, components: List[Component]):
+    def _calculate_criticality(self, components: List[Component],
+                               dependent_counts: List[int]):
         """Calculate criticality scores"""
-        for comp in components:
-            dependent_count = sum(
-                1 for c in components 
-                if comp.id in c.dependencies
-            )
-            
+        for comp, dependent_count in zip(components, dependent_counts):
             if comp.type == 'constraint':
-                comp.criticality = {
-                    'score': 0.95,
-                    'reason': 'Constraint affects all work'
-                }
+                comp.criticality_score = 0.95
+                comp.criticality_reason = 'Constraint affects all work'
             else:
                 score = min(0.3 + (dependent_count * 0.15), 1.0)
-                comp.criticality = {
-                    'score': score,
-                    'reason': f"{dependent_count} components depend on this"
-                }
+                comp.criticality_score = score
+                comp.criticality_reason = f"{dependent_count} components depend on this"
     
     def _find_critical_path(self, components: List[Component]) -> List[str]:
-        """Find critical path through component graph"""
-        visited = set()
-        path = []
-        
-        def dfs(comp_id: str) -> int:
-            if comp_id in visited:
-                return 0
-            visited.add(comp_id)
-            
-            comp = next(c for c in components if c.id == comp_id)
-            if not comp.dependencies:
-                path.append(comp_id)
-                return 1
-            
-            depths = [dfs(dep_id) for dep_id in comp.dependencies]
-            max_depth = max(depths) if depths else 0
-            path.append(comp_id)
-            return max_depth + 1
+        """
+        Find critical path (longest dependency chain) through component graph
         
-        # Start from highest criticality component
-        start = max(components, key=lambda c: c.criticality['score'])
-        dfs(start.id)
+        Reads the depths and parents recorded by _calculate_max_depth and
+        returns the chain in execution order, dependencies first.
+        """
+        if not self._depths:
+            return []
+        
+        # Deepest component ends the path; prefer the most critical on ties
+        end = max(
+            self._depths,
+            key=lambda comp_id: (self._depths[comp_id], self._by_id[comp_id].criticality_score)
+        )
+        
+        path = [end]
+        while path[-1] in self._depth_parent:
+            path.append(self._depth_parent[path[-1]])
         
         return list(reversed(path))
     
     def _find_parallelizable(self, components: List[Component]) -> List[List[str]]:
-        """Find groups of components that can run in parallel"""
-        groups = []
-        processed = set()
+        """
+        Find groups of components that can run in parallel
         
-        for comp in components:
-            if comp.id in processed:
+        Two components can run together only if neither depends on the
+        other, directly or transitively. Reachability is kept as int
+        bitsets (bit i = components[i]), so each compatibility test is a
+        single AND.
+        """
+        index = {c.id: i for i, c in enumerate(components)}
+        
+        # below[i]: everything component i transitively depends on
+        below = self._transitive_closure(
+            index, self._topo_order,
+            lambda comp_id: self._by_id[comp_id].dependencies
+        )
+        
+        # above[i]: everything that transitively depends on component i
+        above = self._transitive_closure(
+            index, reversed(self._topo_order),
+            lambda comp_id: self.reverse_deps[comp_id]
+        )
+        
+        # Greedy colouring: join the first group with no dependency relation.
+        # Components left unresolved by a cycle are never parallelized.
+        groups: List[List[str]] = []
+        masks: List[int] = []
+        for i, comp in enumerate(components):
+            if comp.id not in self._depths:
                 continue
+            related = below[i] | above[i]
             
-            group = [comp.id]
-            processed.add(comp.id)
-            
-            for other in components:
-                if other.id in processed:
-                    continue
-                
-                # Can parallelize if no dependency relationship
-                has_dep_relation = (
-                    other.id in comp.dependencies or
-                    comp.id in other.dependencies
-                )
-                
-                if not has_dep_relation:
-                    group.append(other.id)
-                    processed.add(other.id)
-            
-            if len(group) > 1:
-                groups.append(group)
+            for g, mask in enumerate(masks):
+                if not mask & related:
+                    groups[g].append(comp.id)
+                    masks[g] |= 1 << i
+                    break
+            else:
+                groups.append([comp.id])
+                masks.append(1 << i)
         
-        return groups
+        return [group for group in groups if len(group) > 1]
     
-    def _calculate_max_depth(self, components: List[Component]) -> int:
-        """Calculate maximum depth of dependency graph"""
-        depths = {}
+    def _transitive_closure(self, index: Dict[str, int],
+                            order: Iterable[str],
+                            neighbours: Callable[[str], Iterable[str]]) -> List[int]:
+        """
+        Reachability bitsets in a single pass
         
-        def get_depth(comp_id: str) -> int:
-            if comp_id in depths:
-                return depths[comp_id]
-            
-            comp = next(c for c in components if c.id == comp_id)
-            if not comp.dependencies:
-                depths[comp_id] = 1
-                return 1
-            
-            dep_depths = [get_depth(dep_id) for dep_id in comp.dependencies]
-            depth = max(dep_depths) + 1 if dep_depths else 1
-            depths[comp_id] = depth
-            return depth
+        order must list each component after all of its neighbours, so a
+        component's set is its neighbours' bits OR'd with their
+        already-final sets.
+        """
+        reach = [0] * len(index)
+        for comp_id in order:
+            bits = 0
+            for other_id in neighbours(comp_id):
+                j = index[other_id]
+                bits |= (1 << j) | reach[j]
+            reach[index[comp_id]] = bits
+        
+        return reach
+    
+    def _calculate_max_depth(self, components: List[Component]) -> int:
+        """
+        Calculate maximum depth of dependency graph
         
-        all_depths = [get_depth(c.id) for c in components]
-        return max(all_depths) if all_depths else 1
+        Longest-path DP over a Kahn topological order. Per-component depths
+        are cached in self._depths, the dependency each depth came from in
+        self._depth_parent, and the order itself in self._topo_order.
+        Components on a cycle never resolve and are left out.
+        """
+        pending = {c.id: len(c.dependencies) for c in components}
+        queue = deque(c.id for c in components if not c.dependencies)
+        depths = {comp_id: 1 for comp_id in queue}
+        parents = {}
+        order = []
+        
+        while queue:
+            comp_id = queue.popleft()
+            order.append(comp_id)
+            for dependent_id in self.reverse_deps[comp_id]:
+                pending[dependent_id] -= 1
+                if pending[dependent_id] == 0:
+                    # All dependencies resolved: extend the deepest (most critical on ties)
+                    parent_id = max(
+                        sorted(self._by_id[dependent_id].dependencies),
+                        key=lambda d: (depths[d], self._by_id[d].criticality_score)
+                    )
+                    depths[dependent_id] = depths[parent_id] + 1
+                    parents[dependent_id] = parent_id
+                    queue.append(dependent_id)
+        
+        self._depths = depths
+        self._depth_parent = parents
+        self._topo_order = order
+        return max(depths.values(), default=1)
     
-    def _estimate_complexity(self, components: List[Component]) -> str:
-        """Estimate overall problem complexity"""
-        count = len(components)
-        avg_coupling = sum(c.coupling['score'] for c in components) / max(count, 1)
-        depth = self._calculate_max_depth(components)
+    def _estimate_complexity(self, coupling_scores: List[float]) -> str:
+        """Estimate overall problem complexity from per-component coupling"""
+        count = len(coupling_scores)
+        avg_coupling = sum(coupling_scores) / max(count, 1)
+        depth = max(self._depths.values(), default=1)
         
         if count <= 3 and avg_coupling < 0.4 and depth <= 2:
             return 'low'
@@ -459,14 +591,14 @@ class DecompositionOperator:
         else:
             return 'very high'
     
-    def _calculate_overall_confidence(self, components: List[Component]) -> float:
+    def _calculate_overall_confidence(self, confidences: List[float]) -> float:
         """Calculate average confidence across all components"""
-        if not components:
+        if not confidences:
             return 0.0
-        return sum(c.metadata['confidence'] for c in components) / len(components)
+        return sum(confidences) / len(confidences)
     
-    def _detect_noise(self, problem_text: str, 
-                     components: List[Component]) -> Optional[Dict[str, str]]:
+    def _detect_noise(self, problem_text: str, has_vague: bool,
+                     confidences: List[float]) -> Optional[Dict[str, str]]:
         """Detect different types of noise in the problem"""
         # Epistemic: Missing information
         if len(problem_text) < 50:
@@ -475,17 +607,16 @@ class DecompositionOperator:
                 'description': 'Problem description lacks detail and context'
             }
         
-        # Aleatory: Vague/ambiguous language
-        vague_terms = ['maybe', 'possibly', 'might', 'could', 'approximately']
-        if any(term in problem_text.lower() for term in vague_terms):
+        # Aleatory: Vague/ambiguous language (matched by the master scan)
+        if has_vague:
             return {
                 'type': 'aleatory',
                 'description': 'Problem contains uncertain or probabilistic elements'
             }
         
         # Human: Low confidence components
-        low_conf = [c for c in components if c.metadata['confidence'] < 0.5]
-        if len(low_conf) > len(components) * 0.3:
+        low_conf = sum(1 for confidence in confidences if confidence < 0.5)
+        if low_conf > len(confidences) * 0.3:
             return {
                 'type': 'human',
                 'description': 'High uncertainty in component extraction'
@@ -501,11 +632,36 @@ def decompose(problem_text: str,
     """
     Decompose a problem into components
     
+    Results are memoized on (problem_text, context, constraints), so
+    repeated calls return the same DecompositionResult - treat it as
+    read-only. Use DecompositionOperator directly for a fresh result.
+    
     Example:
         result = decompose(
             "Build HUMMBL Core MCP server with DE, IN, CO transformations",
             constraints=["2 weeks", "solo"]
         )
     """
+    try:
+        context_key = tuple(sorted(context.items())) if context else None
+        constraints_key = tuple(constraints) if constraints else None
+        hash((context_key, constraints_key))
+    except TypeError:
+        # Unhashable or unorderable context values: skip the cache
+        operator = DecompositionOperator()
+        return operator.decompose(problem_text, context, constraints)
+    
+    return _decompose_cached(problem_text, context_key, constraints_key)
+
+
+@lru_cache(maxsize=128)
+def _decompose_cached(problem_text: str,
+                      context_key: Optional[Tuple[Tuple[str, object], ...]],
+                      constraints_key: Optional[Tuple[str, ...]]) -> DecompositionResult:
+    """Memoized decomposition keyed on hashable forms of the arguments"""
     operator = DecompositionOperator()
-    return operator.decompose(problem_text, context, constraints)
+    return operator.decompose(
+        problem_text,
+        dict(context_key) if context_key else None,
+        list(constraints_key) if constraints_key else None
+    )